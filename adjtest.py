@@ -1,18 +1,19 @@
 import pandas as pd
 import numpy as np
-road_adjacency = pd.read_csv("road.csv", header=0, index_col=0, dtype=np.int8)
-road_adjacency = road_adjacency.apply(lambda x: np.bool_(x))
-print(road_adjacency.head())
-tile_adjacency = pd.read_csv("tile.csv", header=0, index_col=0, dtype=np.int8)
-print(tile_adjacency.head())
+road_adjacency = pd.read_csv(
+    "road.csv", header=0, index_col=0).to_numpy(dtype=np.bool_)
+print(road_adjacency[:5])
+tile_adjacency = pd.read_csv(
+    "tile.csv", header=0, index_col=0).to_numpy(dtype=np.bool_)
+print(tile_adjacency[:5])
 roads = np.zeros(72, dtype=np.int8)
 settlements = np.zeros(54, dtype=np.int8)
 cities = np.zeros(54, dtype=np.int8)
 
 location=1
-next_roads = road_adjacency.iloc[:, location]
+next_roads = road_adjacency[:, location]
 print("thing1", next_roads)
-print(road_adjacency.loc[next_roads, :])
-blocking_locations = road_adjacency.iloc[[bool(x) for x in next_roads], :]
+print(road_adjacency[next_roads, :])
+blocking_locations = road_adjacency[next_roads, :]
 
 print(blocking_locations)
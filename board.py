@@ -11,7 +11,10 @@ with Player objects to keep track of resources, Dev cards, VPs, ports, road leng
 
 Stores settlement/road/city information in an array with [0, 1, 2, 3, 4] at each position
 Checks settlement and road legality with an road adjacency matrix created in Excel
-Uses a recursive crawler to check road length after each road is placed
+Uses a depth-first crawler to check road length after each road is placed
+The crawler is compiled with numba, which should be installed for real play:
+without it the same code runs as plain Python and longest road checks
+are several times slower
 Uses an adjacency matrix to produce resources from tiles
 
 """
@@ -21,7 +24,72 @@ import numpy as np
 import pandas as pd
 import functools
 import itertools
-bank_statement = {"Wood": 0, "Brick": 0, "Wheat": 0, "Rock": 0, "Sheep": 0}
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the crawler still works, just as slow plain Python
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+# Resources are kept in fixed-order arrays indexed by these constants
+WOOD, BRICK, WHEAT, ROCK, SHEEP = range(5)
+resource_index = {"Wood": WOOD, "Brick": BRICK,
+                  "Wheat": WHEAT, "Rock": ROCK, "Sheep": SHEEP}
+resource_names = list(resource_index)
+# Ports share the resource bits, plus one for Wild
+port_index = {**resource_index, "Wild": 5}
+
+# Shared read-only receipts: an empty one, and one unit of each resource
+bank_statement = np.zeros(5, dtype=np.int16)
+bank_statement.setflags(write=False)
+unit_receipts = np.eye(5, dtype=np.int16)
+unit_receipts.setflags(write=False)
+
+# Dev cards are small ints
+KNIGHT, MONOPOLY, ROAD_BUILDING, VICTORY, YEAR_OF_PLENTY = range(5)
+
+
+@njit(cache=True)
+def longest_trail(owned, blocked, starts, offsets, junction_roads, road_ends,
+                  used, path_junction, path_next, path_road):
+    """
+    Longest chain of owned roads that never reuses a road,
+    walked junction to junction from each of the start junctions
+    A chain can end at a blocked junction but not pass through it
+
+    The road graph is CSR: the roads meeting at junction j are
+    junction_roads[offsets[j]:offsets[j + 1]]
+
+    used and the path_* arrays are caller-owned scratch space,
+    one slot per road (plus one for the path arrays);
+    used must be all False on entry and is left that way
+    """
+    longest = 0
+    for start in starts:
+        depth = 0
+        path_junction[0] = start
+        path_next[0] = offsets[start]
+        while depth >= 0:
+            junction = path_junction[depth]
+            k = path_next[depth]
+            if k < offsets[junction + 1]:
+                path_next[depth] = k + 1
+                road = junction_roads[k]
+                if owned[road] and not used[road]:
+                    used[road] = True
+                    depth += 1
+                    longest = max(longest, depth)
+                    path_road[depth] = road
+                    junction = road_ends[road, 0] + road_ends[road, 1] - junction
+                    path_junction[depth] = junction
+                    if blocked[junction]:
+                        path_next[depth] = offsets[junction + 1]
+                    else:
+                        path_next[depth] = offsets[junction]
+            else:
+                used[path_road[depth]] = False
+                depth -= 1
+    return longest
 
 
 class Player:
@@ -36,7 +104,8 @@ class Player:
         self.victory_points = 0
         self.facedown_devcards = []
         self.faceup_devcards = []
-        self.ports = set()
+        # bit port_index[p] is set when the player has port p
+        self.ports_mask = 0
         self.winvp = winvp
         self.board = board
         
@@ -59,37 +128,32 @@ class Player:
             self.board.won(self)
 
     def addport(self, port):
-        if not self.ports.issuperset({port}):
-            self.ports = self.ports.union({port})
+        if port is not None:
+            self.ports_mask |= 1 << port_index[port]
+
+    def has_port(self, port):
+        return bool(self.ports_mask & (1 << port_index[port]))
 
     def has(self, resources):
-        for resource in self.resources:
-            if self.resources[resource] < resources[resource]:
-                return False
-        return True
+        return bool((self.resources >= resources).all())
 
     def get(self, resources):
-        for resource in self.resources:
-            self.resources[resource] += resources[resource]
+        self.resources += resources
 
     def spend(self, resources):
         if self.has(resources):
-            for resource in self.resources:
-                self.resources[resource] -= resources[resource]
+            self.resources -= resources
             return True
         return False
 
     def take_random(self):
-        total = sum(self.resources.values())
-        chosen = random.randint(1, total)
-        for r in self.resources:
-            if chosen > self.resources[r]:
-                chosen -= self.resources[r]
-            else:
-                receipt = bank_statement.copy()
-                receipt[r] += 1
-                self.spend(receipt)
-                return receipt
+        total = self.resources.sum()
+        if total > 0:
+            chosen = random.randint(1, total)
+            receipt = unit_receipts[np.searchsorted(
+                np.cumsum(self.resources), chosen)]
+            self.spend(receipt)
+            return receipt
         print("take_random error")
         return False
 
@@ -97,10 +161,10 @@ class Player:
         self.facedown_devcards.append((card, turn_number))
 
     def discard_half(self, resources):
-        hand_size = sum(self.resources.values())
+        hand_size = self.resources.sum()
         if hand_size > 7:
             number_to_discard = hand_size//2
-            if sum(resources.values()) == number_to_discard:
+            if resources.sum() == number_to_discard:
                 if self.spend(resources):
                     return True
                 print("You don't have those resources!")
@@ -158,9 +222,9 @@ class Tile:
         self.robber = True
 
     def give(self, count=1):
-        r = bank_statement.copy()
-        r[self.resource] = count
-        return r
+        if self.resource in resource_index:
+            return unit_receipts[resource_index[self.resource]] * count
+        return bank_statement * count
 
     def dots(self):
         if self.resource != "Desert":
@@ -230,48 +294,80 @@ class Board:
     Board manages the game state
     It handles all transformations from one valid game state to another
     """
-    costs = {"Road": {"Wood": 1, "Brick": 1, "Wheat": 0, "Rock": 0, "Sheep": 0},
-             "Settlement": {"Wood": 1, "Brick": 1, "Wheat": 1, "Rock": 0, "Sheep": 1},
-             "City": {"Wood": 0, "Brick": 0, "Wheat": 2, "Rock": 3, "Sheep": 0},
-             "Development Card": {"Wood": 0, "Brick": 0, "Wheat": 1, "Rock": 1, "Sheep": 1}}
+    # [Wood, Brick, Wheat, Rock, Sheep]
+    costs = {"Road": np.array([1, 1, 0, 0, 0], dtype=np.int16),
+             "Settlement": np.array([1, 1, 1, 0, 1], dtype=np.int16),
+             "City": np.array([0, 0, 2, 3, 0], dtype=np.int16),
+             "Development Card": np.array([0, 0, 1, 1, 1], dtype=np.int16)}
     # cols are junctions, rows are roads
-    road_adjacency = pd.read_csv("road.csv", header=0, index_col=0)
-    road_adjacency = road_adjacency.apply(lambda x: np.bool_(x))
+    # Plain bool ndarrays: pandas indexing is far too slow for the hot paths
+    road_adjacency = pd.read_csv(
+        "road.csv", header=0, index_col=0).to_numpy(dtype=np.bool_)
     # cols are junctions, rows are tiles
-    tile_adjacency = pd.read_csv("tile.csv", header=0, index_col=0)
-    tile_adjacency = tile_adjacency.apply(lambda x: np.bool_(x))
+    tile_adjacency = pd.read_csv(
+        "tile.csv", header=0, index_col=0).to_numpy(dtype=np.bool_)
+    # The board never changes shape, so neighbour tables are built once here
+    # Every lookup below is a row fetch from a contiguous table
+    # rows are junctions, cols are roads
+    settlement_to_road = road_adjacency.T.copy()
+    # rows are junctions, cols are tiles
+    settlement_to_tile = tile_adjacency.T.copy()
+    # roads sharing a junction, and junctions sharing a road
+    road_to_road = (road_adjacency.astype(np.uint8)
+                    @ road_adjacency.T.astype(np.uint8)) > 0
+    np.fill_diagonal(road_to_road, False)
+    settlement_to_settlement = (road_adjacency.T.astype(np.uint8)
+                                @ road_adjacency.astype(np.uint8)) > 0
+    np.fill_diagonal(settlement_to_settlement, False)
+    # the two junctions at the ends of each road
+    road_ends = np.nonzero(road_adjacency)[1].reshape(-1, 2).astype(np.int32)
+    # CSR form of settlement_to_road for the crawler
+    junction_offsets = np.concatenate(
+        ([0], np.cumsum(settlement_to_road.sum(1)))).astype(np.int32)
+    junction_roads = np.nonzero(settlement_to_road)[1].astype(np.int32)
+    # every tile has exactly 6 corners; junctions touch up to 3 tiles
+    tile_settlements = np.nonzero(
+        tile_adjacency)[1].reshape(-1, 6).astype(np.int8)
+    settlement_tiles = [np.flatnonzero(row).astype(np.int8)
+                        for row in settlement_to_tile]
+    # Short index lists for legality checks, so they read a few slots
+    # instead of masking whole 54/72-long arrays
+    # a junction and its neighbours, any of which block a new settlement
+    settlement_blockers = [
+        np.flatnonzero(row).astype(np.int8)
+        for row in settlement_to_settlement | np.eye(54, dtype=np.bool_)]
+    settlement_roads = [np.flatnonzero(row).astype(np.int8)
+                        for row in settlement_to_road]
+    road_neighbors = [np.flatnonzero(row).astype(np.int8)
+                      for row in road_to_road]
+    for table in (road_adjacency, tile_adjacency, settlement_to_road,
+                  settlement_to_tile, road_to_road, settlement_to_settlement):
+        table.setflags(write=False)
+    del table
 
     @staticmethod
     def s2r(location):
-        x = Board.road_adjacency.iloc[:, location]
-        return x
+        return Board.settlement_to_road[location]
 
     @staticmethod
     def r2s(location):
-        x = Board.road_adjacency.iloc[location, :]
-        return x
+        return Board.road_adjacency[location]
 
     @staticmethod
     def r2r(location):
-        s = Board.r2s(location)
-        r = np.any(Board.road_adjacency.loc[:, s], 1)
-        r[location] = False
-        return r
+        return Board.road_to_road[location]
 
     @staticmethod
     def s2s(location):
-        r = Board.s2r(location)
-        s = np.any(Board.road_adjacency.loc[r, :], 0)
-        s[location] = False
-        return s
+        return Board.settlement_to_settlement[location]
 
     @staticmethod
     def s2t(location):
-        return Board.tile_adjacency.iloc[:, location]
+        return Board.settlement_to_tile[location]
 
     @staticmethod
     def t2s(location):
-        return Board.tile_adjacency.iloc[location, :]
+        return Board.tile_adjacency[location]
 
     def __init__(self, manager, n_players, border_setup="standard", tile_setup="random"):
         """
@@ -302,27 +398,38 @@ class Board:
             raise ValueError("Bad Tile Setup")
         number_order = [5, 6, 11, 5, 8, 10, 9,
                         2, 10, 12, 9, 8, 3, 4, 3, 4, 6, 11]
-        self.tiles = []
-        for resource in resources:
-            if resource == "Desert":
-                self.tiles.append(Tile("Desert", 0))
-            else:
-                self.tiles.append(Tile(resource, number_order.pop(0)))
+        # Tiles are stored as parallel arrays so a roll is one vectorised pass
+        # The Desert is resource -1 and number 0, and starts with the robber
+        self.tile_resource = np.full(len(resources), -1, dtype=np.int8)
+        self.tile_number = np.zeros(len(resources), dtype=np.int8)
+        for i, resource in enumerate(resources):
+            if resource != "Desert":
+                self.tile_resource[i] = resource_index[resource]
+                self.tile_number[i] = number_order.pop(0)
+        self.tile_robber = self.tile_resource < 0
 
         self.border = Border(border_setup)
 
         self.roads = np.zeros(72, dtype=np.int8)
         self.settlements = np.zeros(54, dtype=np.int8)
         self.cities = np.zeros(54, dtype=np.int8)
-
-        self.devdeck = [
-            *["Knight"]*14,
-            *["Monopoly"]*2,
-            *["Road Building"]*2,
-            *["Victory"]*5,
-            *["Year of Plenty"]*2
-        ]
+        # Scratch space reused by every longest road search:
+        # used roads, then the junction, next option and road at each depth
+        self._road_used = np.zeros(72, dtype=np.bool_)
+        self._road_path = np.zeros((3, 73), dtype=np.int32)
+        # What each player gets from a roll, cleared and reused every roll
+        self._gains = np.zeros((n_players + 1, 5), dtype=np.int16)
+
+        self.devdeck = np.array([
+            *[KNIGHT]*14,
+            *[MONOPOLY]*2,
+            *[ROAD_BUILDING]*2,
+            *[VICTORY]*5,
+            *[YEAR_OF_PLENTY]*2
+        ], dtype=np.int8)
         random.shuffle(self.devdeck)
+        # Cards are drawn from the top down; devdeck[:devdeck_top] is left
+        self.devdeck_top = len(self.devdeck)
 
         # Using an extra player
         # to make players array practically start at 0
@@ -331,74 +438,113 @@ class Board:
         self.last_turn = 0
         self.turn_number = 0
 
-    def check_road_length(self, player, location):
+    def tile(self, location):
+        """
+        A Tile copy of one board tile, for its number, dots and color
+        """
+        resource = self.tile_resource[location]
+        tile = Tile(resource_names[resource] if resource >= 0 else "Desert",
+                    int(self.tile_number[location]))
+        tile.robber = bool(self.tile_robber[location])
+        return tile
+
+    def pack(self):
+        """
+        Packs every road, settlement and city into 3 bits each
+        plus one byte for the robber's tile: 69 bytes per board
+        Player hands and cards are not included
+        """
+        slots = np.concatenate(
+            (self.roads, self.settlements, self.cities)).astype(np.uint8)
+        bits = np.unpackbits(slots[:, None], axis=1)[:, -3:]
+        robber = np.flatnonzero(self.tile_robber)[0]
+        return np.packbits(bits).tobytes() + bytes([robber])
+
+    def unpack(self, buf):
+        """
+        Restores the pieces and robber from the output of pack
+        """
+        bits = np.unpackbits(np.frombuffer(buf, dtype=np.uint8, count=68))
+        slots = bits[:540].reshape(180, 3) @ np.array([4, 2, 1])
+        self.roads[:] = slots[:72]
+        self.settlements[:] = slots[72:126]
+        self.cities[:] = slots[126:]
+        self.tile_robber[:] = False
+        self.tile_robber[buf[68]] = True
+
+    def hash(self):
+        """
+        Hash of the packed board, for transposition tables in a search
+        """
+        return hash(self.pack())
+
+    def check_road_length(self, player):
         """
         This is the most computer-science intensive part of the game
-        It crawls through the road-adjacency graph recursively
-        to find the longest road
+        It crawls through the road graph depth-first from every junction
+        the player's roads touch to find the longest road
+        Another player's settlement or city cuts a road in two,
+        so the length is stored as found even when it has gone down
         """
-        def crawler(used, location, mode="distance"):
-            joints = Board.road_adjacency.iloc[:, location]
-            if sum(joints) != 2:
-                print("Bad adjacency graph: road doesn't have 2 endpoints")
-            options = np.zeros(72, dtype=np.int8)
-            for i, joint in enumerate(joints):
-                options += self.roads * \
-                    Board.road_adjacency.iloc[joint, :] == player
-            options = options*(1-used)
-            here = np.zeros(72, dtype=np.int8)
-            if sum(options) > 0:
-                paths = []
-                for i, option in enumerate(options):
-                    if option == 1:
-                        here = np.zeros(72, dtype=np.int8)
-                        here[location] = 1
-                        paths.append(crawler(used + here, i))
-                if mode == "distance":
-                    return max(paths) + 1
-                elif mode == "ends":
-                    return np.sum(paths, 0)
-                return False
-            else:
-                if mode == "distance":
-                    return 1
-                elif mode == "ends":
-                    return here
-                return False
-        right_points = Board.road_adjacency.iloc[:, location]
-        for i, h in enumerate(right_points):
-            if h == 1:
-                right_points[h] = 0
-        left_endpoints = crawler([right_points], location, mode="ends")
-        longest_road = 0
-        for i, endpoint in enumerate(left_endpoints):
-            if endpoint == 1:
-                longest_road = max(
-                    longest_road, crawler([], i, mode="distance"))
+        owned = self.roads == player
+        blocked = ((self.settlements != 0) & (self.settlements != player)) | \
+            ((self.cities != 0) & (self.cities != player))
+        starts = np.flatnonzero(Board.road_adjacency[owned].any(0))
+        longest_road = longest_trail(owned, blocked, starts,
+                                     Board.junction_offsets,
+                                     Board.junction_roads, Board.road_ends,
+                                     self._road_used, *self._road_path)
         print("Found a long road:", longest_road)
-        if longest_road >= 5:
-            if self.players[player].road_length < longest_road:
-                self.players[player].road_length = longest_road
-                for other_player in self.players:
-                    if other_player.road_length >= longest_road:
-                        break
-                else:
-                    for other_player in self.players:
-                        player.longest_road = False
-                    self.players[player].longest_road = True
+        self.players[player].road_length = longest_road
+        self.award_longest_road()
+
+    def award_longest_road(self):
+        """
+        Longest Road goes to the one player with the longest road of 5+
+        The holder keeps it through a tie, but if the holder falls short
+        and the lead is tied, nobody holds it
+        """
+        lengths = [p.road_length for p in self.players]
+        best = max(lengths)
+        holder = None
+        for i, p in enumerate(self.players):
+            if p.longest_road:
+                holder = i
+        if holder is not None and lengths[holder] == best and best >= 5:
+            return
+        leaders = [i for i, length in enumerate(lengths) if length == best]
+        winner = None
+        if best >= 5 and len(leaders) == 1:
+            winner = leaders[0]
+        if winner != holder:
+            if holder is not None:
+                self.players[holder].longest_road = False
+                self.players[holder].victory_points -= 2
+            if winner is not None:
+                self.players[winner].longest_road = True
+                self.players[winner].addvp()
+                self.players[winner].addvp()
+
+    def recheck_cut_roads(self, player, location):
+        """
+        A new building at location can cut other players' roads through it
+        """
+        for other in np.unique(self.roads[Board.settlement_roads[location]]):
+            if other != 0 and other != player:
+                self.check_road_length(other)
 
     def build_road(self, player, location, free=False):
         if self.roads[location] == 0 and self.players[player].roads > 0:
-            next_settlements = Board.r2s(location)
-            next_roads = Board.r2r(location)
-            has_settlement = sum(self.settlements[next_settlements] == player)
-            has_city = sum(self.cities[next_settlements] == player)
-            has_road = sum(self.roads[next_roads] == player)
-            if has_settlement + has_road + has_city > 0:
+            next_settlements = Board.road_ends[location]
+            next_roads = Board.road_neighbors[location]
+            # Cheapest checks first; later ones only run if needed
+            if (self.settlements[next_settlements] == player).any() or \
+                    (self.cities[next_settlements] == player).any() or \
+                    (self.roads[next_roads] == player).any():
                 if free or self.players[player].spend(Board.costs["Road"]):
                     self.roads[location] = player
                     self.players[player].roads -= 1
-                    self.check_road_length(player, location)
+                    self.check_road_length(player)
                     return True
                 print("No Resources!")
                 return False
@@ -408,14 +554,15 @@ class Board:
         return False
 
     def build_settlement(self, player, location, initial=False, getnear=False):
-        blocking_locations = Board.s2s(location)
-        if sum((self.settlements+self.cities)*blocking_locations) == 0:
-            if sum(self.roads[Board.s2r(location)] == player) > 0:
+        blocking_locations = Board.settlement_blockers[location]
+        if not (self.settlements[blocking_locations].any() or self.cities[blocking_locations].any()):
+            if (self.roads[Board.settlement_roads[location]] == player).any():
                 if self.players[player].spend(Board.costs["Settlement"]):
                     self.settlements[location] = player
                     self.players[player].addvp()
                     self.players[player].settlements -= 1
                     self.players[player].addport(self.border.port(location))
+                    self.recheck_cut_roads(player, location)
                     return True
                 else:
                     print("No Resources!")
@@ -424,10 +571,11 @@ class Board:
                 self.players[player].settlements -= 1
                 self.players[player].addvp()
                 self.players[player].addport(self.border.port(location))
+                self.recheck_cut_roads(player, location)
                 if getnear:
-                    for i, t in enumerate(Board.s2t(location)):
-                        if t:
-                            self.players[player].get(self.tiles[i].give())
+                    near = self.tile_resource[Board.settlement_tiles[location]]
+                    np.add.at(self.players[player].resources,
+                              near[near >= 0], 1)
                 return True
             else:
                 print("No Road")
@@ -449,9 +597,11 @@ class Board:
         return False
 
     def buy_devcard(self, player):
-        if len(self.devdeck) > 0:
+        if self.devdeck_top > 0:
             if self.players[player].spend(Board.costs["Development Card"]):
-                self.players[player].get_devcard(self.devdeck.pop())
+                self.devdeck_top -= 1
+                self.players[player].get_devcard(
+                    int(self.devdeck[self.devdeck_top]), self.turn_number)
                 return True
             print("No Resources!")
             return False
@@ -468,28 +618,28 @@ class Board:
         if fix is not None:
             result = fix
         if result != 7:
-            for i, tile in enumerate(self.tiles):
-                if tile.produce(result):
-                    spots = Board.t2s(i)
-                    settlements = self.settlements[spots]
-                    cities = self.cities[spots]
-                    for settlement in settlements:
-                        if settlement != 0:
-                            self.players[settlement].get(tile.give(1))
-                    for city in cities:
-                        if city != 0:
-                            self.players[city].get(tile.give(2))
+            active = (self.tile_number == result) & ~self.tile_robber & (
+                self.tile_resource >= 0)
+            # The 6 corners of each producing tile, and what that tile makes
+            spots = Board.tile_settlements[active]
+            produced = self.tile_resource[active][:, None]
+            # Row 0 soaks up the empty spots
+            gains = self._gains
+            gains[:] = 0
+            np.add.at(gains, (self.settlements[spots], produced), 1)
+            np.add.at(gains, (self.cities[spots], produced), 2)
+            for player, gain in zip(self.players[1:], gains[1:]):
+                player.get(gain)
             return result
         else:
             return 7
 
     def rob(self, player1, player2, location):
-        if self.tiles[location].robber == False:
-            spots = Board.t2s(location)
-            if sum(self.settlements[spots] == player2) > 0 or sum(self.cities[spots] == player2) > 0:
-                for tile in self.tiles:
-                    tile.clearrobber()
-                self.tiles[location].rob()
+        if not self.tile_robber[location]:
+            spots = Board.tile_settlements[location]
+            if (self.settlements[spots] == player2).any() or (self.cities[spots] == player2).any():
+                self.tile_robber[:] = False
+                self.tile_robber[location] = True
                 self.players[player1].get(self.players[player2].take_random())
                 return True
             print("That player isn't next to that tile!")
@@ -519,19 +669,22 @@ class Board:
         return False
 
     def monopoly(self, player, special):
-        if type(special) == str and special in bank_statement.keys():
-            for i, player in enumerate(self.players):
-                receipt = bank_statement.copy()
-                resource_number = player.resources[special]
-                receipt[special] = resource_number
-                self.players[player].get(self.players[i].spend(receipt))
+        if type(special) == str and special in resource_index:
+            # Everyone's cards of that resource, the caller's included,
+            # end up in the caller's hand
+            resource = resource_index[special]
+            taken = 0
+            for other in self.players[1:]:
+                taken += other.resources[resource]
+                other.resources[resource] = 0
+            self.players[player].resources[resource] += taken
             return True
-        print("Monopoly takes a bank statement!")
+        print("Monopoly takes a resource name!")
         return False
 
     def year_of_plenty(self, player, special):
-        if type(special) == dict and len(special) == 5:
-            if sum(special.values()) == 2:
+        if type(special) == np.ndarray and len(special) == 5:
+            if special.sum() == 2:
                 self.players[player].get(special)
                 return True
             print("That wasn't two resources!")
@@ -548,24 +701,24 @@ class Board:
 
     def activate_devcard(self, player, card, turn_number, special):
         if self.players[player].can_flip_devcard(card, self.turn_number):
-            if card == "Knight":
+            if card == KNIGHT:
                 if self.knight(player, special):
                     self.players[player].flip_devcard(card, turn_number)
                     return True
-            elif card == "Victory":
+            elif card == VICTORY:
                 self.players[player].addvp()
                 self.players[player].flip_devcard(card, turn_number)
                 return True
-            elif card == "Monopoly":
+            elif card == MONOPOLY:
                 if self.monopoly(player, special):
                     self.players[player].flip_devcard(card, turn_number)
                     return True
-            elif card == "Road Building":
+            elif card == ROAD_BUILDING:
                 if self.road_building(player, special):
                     self.players[player].flip_devcard(card, turn_number)
                     return True
                 return False
-            elif card == "Year of Plenty":
+            elif card == YEAR_OF_PLENTY:
                 if self.year_of_plenty(player, special):
                     self.players[player].flip_devcard(card, turn_number)
                     return True
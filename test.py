@@ -6,51 +6,58 @@ import numpy as np
 class PlayerTest(unittest.TestCase):
     def setUp(self):
         self.player = board.Player(None)
-        self.bank_statement = {"Wood": 1, "Brick": 1,
-                               "Wheat": 1, "Rock": 1, "Sheep": 1}
-        self.blank_bank_statement = {
-            "Wood": 0, "Brick": 0, "Wheat": 0, "Rock": 0, "Sheep": 0}
+        self.bank_statement = np.ones(5, dtype=np.int16)
+        self.blank_bank_statement = np.zeros(5, dtype=np.int16)
         self.player.get(self.bank_statement)
 
     def testHas(self):
         self.assertTrue(self.player.has(self.bank_statement))
         extra = self.bank_statement.copy()
-        extra["Wood"] += 1
+        extra[board.WOOD] += 1
         self.assertFalse(self.player.has(extra))
 
     def testGet(self):
         self.player.get(self.bank_statement)
-        should_have = {a: 2*b for a, b in self.bank_statement.items()}
-        self.assertEqual(self.player.resources, should_have)
+        should_have = 2*self.bank_statement
+        np.testing.assert_array_equal(self.player.resources, should_have)
 
     def testSpend(self):
         self.assertTrue(self.player.spend(self.bank_statement))
-        self.assertEquals(self.player.resources, {
-                          a: 0 for a in self.bank_statement})
+        np.testing.assert_array_equal(
+            self.player.resources, self.blank_bank_statement)
 
     def testTakeRandom(self):
-        stolen = self.blank_bank_statement
+        stolen = self.blank_bank_statement.copy()
         for _ in range(5):
-            find = self.player.take_random()
-            for key in stolen:
-                stolen[key] += find[key]
-        self.assertEquals(stolen, self.bank_statement)
+            stolen += self.player.take_random()
+        np.testing.assert_array_equal(stolen, self.bank_statement)
 
     def testDiscardHalf(self):
         two_resources = self.blank_bank_statement.copy()
-        two_resources["Wheat"] = 1
-        two_resources["Rock"] = 1
+        two_resources[board.WHEAT] = 1
+        two_resources[board.ROCK] = 1
         self.assertFalse(self.player.discard_half(two_resources))
         four_resources = two_resources.copy()
-        four_resources["Sheep"] = 1
-        four_resources["Brick"] = 1
+        four_resources[board.SHEEP] = 1
+        four_resources[board.BRICK] = 1
         three_resources = two_resources.copy()
-        three_resources["Sheep"] += 1 
+        three_resources[board.SHEEP] += 1 
         self.player.get(three_resources)
         self.assertTrue(self.player.discard_half(four_resources))
         should_have = two_resources.copy()
-        should_have["Wood"] = 1
-        self.assertEquals(self.player.resources, should_have)
+        should_have[board.WOOD] = 1
+        should_have[board.SHEEP] = 1
+        np.testing.assert_array_equal(self.player.resources, should_have)
+
+    def testAddport(self):
+        self.player.addport(None)
+        self.assertEqual(self.player.ports_mask, 0)
+        self.player.addport("Wheat")
+        self.player.addport("Wild")
+        self.player.addport("Wheat")
+        self.assertTrue(self.player.has_port("Wheat"))
+        self.assertTrue(self.player.has_port("Wild"))
+        self.assertFalse(self.player.has_port("Wood"))
 
     def testGetDevcard(self):
         self.player.get_devcard("Knight", 2)
@@ -73,8 +80,7 @@ class TileTest(unittest.TestCase):
         self.forest = board.Tile("Wood", 6)
         self.desert = board.Tile("Desert", 0)
         self.robbed = board.Tile("Wood", 3)
-        self.blank_bank_statement = {
-            "Wood": 0, "Brick": 0, "Wheat": 0, "Rock": 0, "Sheep": 0}
+        self.blank_bank_statement = np.zeros(5, dtype=np.int16)
         self.robbed.rob()
 
     def testProduce(self):
@@ -84,19 +90,17 @@ class TileTest(unittest.TestCase):
 
     def testGive(self):
         one_resource = self.blank_bank_statement.copy()
-        one_resource["Wood"] = 1
-        self.assertEquals(self.forest.give(), one_resource)
+        one_resource[board.WOOD] = 1
+        np.testing.assert_array_equal(self.forest.give(), one_resource)
 
 
 class BoardTest(unittest.TestCase):
     def setUp(self):
         self.standard = board.Board(None, 3, "standard", "basic")
         # self.free = board.Board(None, 4, "random", "random")
-        self.bank_statement = {"Wood": 1, "Brick": 1,
-                               "Wheat": 1, "Rock": 1, "Sheep": 1}
-        self.blank_bank_statement = {
-            "Wood": 0, "Brick": 0, "Wheat": 0, "Rock": 0, "Sheep": 0}
-        self.beginning = board.Board(None, 2, "standard", "basic")
+        self.bank_statement = np.ones(5, dtype=np.int16)
+        self.blank_bank_statement = np.zeros(5, dtype=np.int16)
+        self.beginning = board.Board(None, 4, "standard", "basic")
         self.beginning.build_settlement(1, 0, initial=True)
         self.beginning.build_settlement(4, 4, initial=True)
         self.beginning.build_road(1, 0, free=True)
@@ -108,33 +112,133 @@ class BoardTest(unittest.TestCase):
         boundingsettlements = np.zeros(54, dtype=np.bool_)
         boundingsettlements[0] = True
         boundingsettlements[1] = True
-        self.assertEqual(board.Board.r2s(0), boundingsettlements)
+        np.testing.assert_array_equal(board.Board.r2s(0), boundingsettlements)
+        for tile in range(19):
+            np.testing.assert_array_equal(
+                board.Board.tile_settlements[tile],
+                np.flatnonzero(board.Board.tile_adjacency[tile]))
         
     def testInit(self):
-        ddeck = [
-            *["Knight"]*14,
-            *["Monopoly"]*2,
-            *["Road Building"]*2,
-            *["Victory"]*5,
-            *["Year of Plenty"]*2
-        ]
-        self.assertNotEqual(self.standard.devdeck, ddeck)
-        self.assertEqual(sorted(self.standard.devdeck), ddeck)
+        ddeck = np.array([
+            *[board.KNIGHT]*14,
+            *[board.MONOPOLY]*2,
+            *[board.ROAD_BUILDING]*2,
+            *[board.VICTORY]*5,
+            *[board.YEAR_OF_PLENTY]*2
+        ], dtype=np.int8)
+        self.assertFalse((self.standard.devdeck == ddeck).all())
+        np.testing.assert_array_equal(np.sort(self.standard.devdeck), ddeck)
+        self.assertEqual(self.standard.devdeck_top, 25)
+
+    def testTile(self):
+        brick = self.standard.tile(0)
+        self.assertEqual((brick.resource, brick.number), ("Brick", 5))
+        self.assertEqual(brick.dots(), 4)
+        self.assertFalse(brick.robber)
+        desert = self.standard.tile(18)
+        self.assertEqual(desert.resource, "Desert")
+        self.assertTrue(desert.robber)
 
     def testRoll(self):
         for i in range(1, 13):
             self.standard.roll(fix=i)
 
+    def testRollProduces(self):
+        tile = 0
+        number = self.standard.tile_number[tile]
+        resource = self.standard.tile_resource[tile]
+        # Corners no other tile with the same number touches
+        corners = [
+            c for c in board.Board.tile_settlements[tile]
+            if (self.standard.tile_number[board.Board.settlement_tiles[c]]
+                == number).sum() == 1]
+        self.standard.settlements[corners[0]] = 1
+        self.standard.cities[corners[1]] = 2
+        should_have = [p.resources.copy() for p in self.standard.players]
+        should_have[1][resource] += 1
+        should_have[2][resource] += 2
+        self.standard.roll(fix=number)
+        for player, resources in zip(self.standard.players, should_have):
+            np.testing.assert_array_equal(player.resources, resources)
+
+        self.assertTrue(self.standard.rob(1, 2, tile))
+        robbed = [p.resources.copy() for p in self.standard.players]
+        self.standard.roll(fix=number)
+        self.assertEqual(self.standard.roll(fix=7), 7)
+        for player, resources in zip(self.standard.players, robbed):
+            np.testing.assert_array_equal(player.resources, resources)
+
     def testBuyRoad(self):
         self.assertFalse(self.standard.build_road(1, 1))
         self.assertTrue(self.beginning.build_road(1, 1, free=True))
 
+    def testLongestRoad(self):
+        for road in range(1, 4):
+            self.assertTrue(self.beginning.build_road(1, road, free=True))
+        self.assertFalse(self.beginning.players[1].longest_road)
+        self.assertTrue(self.beginning.build_road(1, 29, free=True))
+        self.assertTrue(self.beginning.players[1].longest_road)
+        self.assertEqual(self.beginning.players[1].road_length, 5)
+        self.assertEqual(self.beginning.players[1].victory_points, 3)
+
+    def testRoadCut(self):
+        for road in (1, 2, 3, 29):
+            self.beginning.build_road(1, road, free=True)
+        self.assertTrue(self.beginning.players[1].longest_road)
+        # Player 2 settles in the middle of player 1's road
+        self.assertTrue(self.beginning.build_settlement(2, 2, initial=True))
+        self.assertEqual(self.beginning.players[1].road_length, 3)
+        self.assertFalse(self.beginning.players[1].longest_road)
+        self.assertEqual(self.beginning.players[1].victory_points, 1)
+
+    def testRoadBlocked(self):
+        # Player 4's settlement on junction 4 cuts road 4 off the rest
+        for road in (1, 2, 3, 4):
+            self.assertTrue(self.beginning.build_road(1, road, free=True))
+        self.assertFalse(self.beginning.players[1].longest_road)
+
     def testBuySettlement(self):
         self.assertFalse(self.standard.build_settlement(1, 1))
 
+    def testGetnear(self):
+        self.assertTrue(self.standard.build_settlement(
+            1, 0, initial=True, getnear=True))
+        near = self.standard.tile_resource[board.Board.settlement_tiles[0]]
+        self.assertEqual(self.standard.players[1].resources.sum(),
+                         (near >= 0).sum())
+
     def testBuyCity(self):
         self.assertFalse(self.standard.build_city(1, 1))
 
+    def testBuyDevcard(self):
+        self.assertFalse(self.standard.buy_devcard(1))
+        self.standard.players[1].get(board.Board.costs["Development Card"])
+        self.assertTrue(self.standard.buy_devcard(1))
+        self.assertEqual(self.standard.devdeck_top, 24)
+        self.assertEqual(self.standard.players[1].facedown_devcards,
+                         [(self.standard.devdeck[24], 0)])
+
+    def testMonopoly(self):
+        self.standard.players[2].get(self.bank_statement)
+        self.standard.players[3].get(2*self.bank_statement)
+        self.assertTrue(self.standard.monopoly(1, "Wheat"))
+        self.assertEqual(self.standard.players[1].resources[board.WHEAT], 3)
+        self.assertEqual(self.standard.players[2].resources[board.WHEAT], 0)
+        self.assertEqual(self.standard.players[3].resources[board.WHEAT], 0)
+        self.assertEqual(self.standard.players[3].resources[board.WOOD], 2)
+        self.assertFalse(self.standard.monopoly(1, "Gold"))
+
+    def testPack(self):
+        packed = self.beginning.pack()
+        self.assertEqual(len(packed), 69)
+        self.assertNotEqual(packed, self.standard.pack())
+        self.standard.unpack(packed)
+        np.testing.assert_array_equal(self.standard.roads, self.beginning.roads)
+        np.testing.assert_array_equal(
+            self.standard.settlements, self.beginning.settlements)
+        np.testing.assert_array_equal(self.standard.cities, self.beginning.cities)
+        self.assertEqual(self.standard.hash(), self.beginning.hash())
+
 
 if __name__ == "__main__":
     unittest.main()